@@ -0,0 +1,114 @@
+"""
+Secrets Cache
+
+Shared Secrets Manager lookup for the Slack Lambda functions. Secrets are
+read through the AWS Parameters and Secrets Lambda Extension when it is
+available, falling back to the Secrets Manager API, and cached for the
+lifetime of the container.
+"""
+import os
+from typing import Dict, Any, Optional
+import boto3
+import orjson
+import urllib3
+from aws_lambda_powertools import Logger
+
+logger = Logger(child=True)
+
+EXTENSION_PORT = os.environ.get("PARAMETERS_SECRETS_EXTENSION_HTTP_PORT", "2773")
+
+# Secret ID -> parsed secret
+_CREDENTIALS: Dict[str, Dict[str, Any]] = {}
+
+_http: Optional[urllib3.PoolManager] = None
+_secrets_client = None
+
+
+def _fetch_from_extension(secret_id: str) -> Optional[str]:
+    """
+    Read a secret string from the Parameters and Secrets Lambda Extension.
+
+    Args:
+        secret_id: Secret name or ARN
+
+    Returns:
+        The secret string, or None if the extension is not available
+    """
+    global _http
+
+    session_token = os.environ.get("AWS_SESSION_TOKEN")
+    if not session_token:
+        return None
+
+    if _http is None:
+        _http = urllib3.PoolManager(timeout=urllib3.Timeout(connect=0.2, read=2.0), retries=False)
+
+    try:
+        response = _http.request(
+            "GET",
+            f"http://localhost:{EXTENSION_PORT}/secretsmanager/get",
+            fields={"secretId": secret_id},
+            headers={"X-Aws-Parameters-Secrets-Token": session_token},
+        )
+    except urllib3.exceptions.HTTPError as e:
+        logger.debug("Secrets extension not reachable", extra={"error": str(e)})
+        return None
+
+    if response.status != 200:
+        logger.warning("Secrets extension returned an error", extra={"status": response.status})
+        return None
+
+    return orjson.loads(response.data)["SecretString"]
+
+
+def _get_secrets():
+    """Get or create the Secrets Manager client."""
+    global _secrets_client
+
+    if _secrets_client is None:
+        _secrets_client = boto3.client("secretsmanager")
+
+    return _secrets_client
+
+
+def _fetch_from_api(secret_id: str) -> str:
+    """
+    Read a secret string from the Secrets Manager API.
+
+    Args:
+        secret_id: Secret name or ARN
+
+    Returns:
+        The secret string
+
+    Raises:
+        ClientError: If secret cannot be retrieved
+    """
+    response = _get_secrets().get_secret_value(SecretId=secret_id)
+    return response["SecretString"]
+
+
+def get_secret(secret_id: str) -> Dict[str, Any]:
+    """
+    Get a JSON secret, fetching it only on first use in this container.
+
+    Args:
+        secret_id: Secret name or ARN
+
+    Returns:
+        Parsed secret data
+
+    Raises:
+        ClientError: If secret cannot be retrieved
+    """
+    secret_data = _CREDENTIALS.get(secret_id)
+
+    if secret_data is None:
+        secret_string = _fetch_from_extension(secret_id)
+        if secret_string is None:
+            secret_string = _fetch_from_api(secret_id)
+
+        secret_data = orjson.loads(secret_string)
+        _CREDENTIALS[secret_id] = secret_data
+
+    return secret_data
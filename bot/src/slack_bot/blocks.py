@@ -4,58 +4,110 @@ Dynamic Action Menu Builder
 Scans the actions directory and builds Slack UI components
 from action definitions.
 """
-import json
 import os
-from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, FrozenSet, Tuple
+import orjson
 from aws_lambda_powertools import Logger
 
 logger = Logger(child=True)
 
-# Store action data globally
-action_data: Dict[str, Any] = {}
 
+def plain_text(text: str) -> Dict[str, str]:
+    """Build a Slack plain_text text object."""
+    return {"type": "plain_text", "text": text}
 
-def load_actions() -> Dict[str, Any]:
+
+def mrkdwn(text: str) -> Dict[str, str]:
+    """Build a Slack mrkdwn text object."""
+    return {"type": "mrkdwn", "text": text}
+
+
+# Parsed modals and load errors, cached on first use of each action
+_action_modals: Dict[str, Dict[str, Any]] = {}
+_action_errors: Dict[str, str] = {}
+
+
+def _scan_action_names() -> Dict[str, str]:
     """
-    Load all action definitions from the actions directory.
+    Find all action definitions in the actions directory.
+
+    Only the directory listing is read here; modal bodies are parsed
+    lazily by get_action_modal().
 
     Returns:
-        Dictionary mapping action names to their modal definitions
+        Dictionary mapping action names to their modal.json paths
     """
     actions = {}
-    actions_dir = Path(__file__).parent / "actions"
+    actions_dir = os.path.join(os.path.dirname(__file__), "actions")
 
-    if not actions_dir.exists():
-        logger.warning(f"Actions directory not found: {actions_dir}")
+    if not os.path.isdir(actions_dir):
+        logger.warning("Actions directory not found", extra={"actions_dir": actions_dir})
         return actions
 
-    # Scan for action directories
-    for action_path in actions_dir.iterdir():
-        if not action_path.is_dir() or action_path.name.startswith((".", "_")):
-            continue
+    # Scan for action directories (DirEntry caches file type, saving a stat per entry)
+    with os.scandir(actions_dir) as it:
+        for entry in it:
+            if not entry.is_dir() or entry.name.startswith((".", "_")):
+                continue
+
+            modal_file = os.path.join(entry.path, "modal.json")
+
+            if not os.path.isfile(modal_file):
+                logger.warning("No modal.json found for action", extra={"action": entry.name})
+                continue
+
+            actions[entry.name] = modal_file
+
+    logger.info("Found actions", extra={"action_count": len(actions)})
+    return actions
+
+
+def get_action_modal(name: str) -> Dict[str, Any]:
+    """
+    Get the modal definition for an action, loading it on first access.
+
+    Args:
+        name: Name of the action
 
-        modal_file = action_path / "modal.json"
+    Returns:
+        Modal definition with callback_id and private_metadata set
 
-        if not modal_file.exists():
-            logger.warning(f"No modal.json found for action: {action_path.name}")
-            continue
+    Raises:
+        KeyError: If the action does not exist
+        ValueError: If the modal.json cannot be read or is not a JSON object
+    """
+    modal_data = _action_modals.get(name)
+
+    if modal_data is None:
+        if name in _action_errors:
+            raise ValueError(_action_errors[name])
+
+        modal_file = _action_paths[name]
 
         try:
-            with open(modal_file, "r") as f:
-                modal_data = json.load(f)
+            with open(modal_file, "rb") as f:
+                modal_data = orjson.loads(f.read())
 
-            actions[action_path.name] = modal_data
-            logger.info(f"Loaded action: {action_path.name}")
+            if not isinstance(modal_data, dict):
+                raise TypeError(f"expected a JSON object, got {type(modal_data).__name__}")
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in {modal_file}: {e}")
-        except Exception as e:
-            logger.error(f"Error loading action {action_path.name}: {e}")
+        except (OSError, orjson.JSONDecodeError, TypeError) as e:
+            logger.error("Invalid modal definition", extra={"modal_file": modal_file, "error": str(e)})
+            # Remember the failure so the broken file isn't re-read on every selection
+            _action_errors[name] = f"Invalid modal definition for action {name}: {e}"
+            raise ValueError(_action_errors[name]) from e
 
-    logger.info(f"Loaded {len(actions)} actions")
-    return actions
+        # Finalize the modal for submission once, so it can be served as-is
+        modal_data["callback_id"] = "updated_modal"
+        modal_data["private_metadata"] = name
+
+        _action_modals[name] = modal_data
+        logger.info("Loaded action", extra={"action": name})
+
+    return modal_data
 
 
-# Load actions on module import
-action_data = load_actions()
+# Scan action names on module import
+_action_paths = _scan_action_names()
+action_names: FrozenSet[str] = frozenset(_action_paths)
+sorted_action_names: Tuple[str, ...] = tuple(sorted(_action_paths))
@@ -0,0 +1,31 @@
+"""
+orjson Codec for Slack SDK
+
+Points the json module references used by slack_sdk and Slack Bolt for
+request parsing and payload serialization at orjson, without replacing
+the stdlib json module for the rest of the process.
+"""
+import json
+from types import SimpleNamespace
+from typing import Any
+import orjson
+import slack_bolt.request.internals
+import slack_bolt.response.response
+import slack_sdk.web.base_client
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON str (orjson returns bytes)."""
+    return orjson.dumps(obj).decode()
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers that
+# catch json.decoder.JSONDecodeError keep working
+_codec = SimpleNamespace(dumps=_dumps, loads=orjson.loads, decoder=json.decoder)
+
+
+def install() -> None:
+    """Route Slack SDK and Bolt JSON encoding and decoding through orjson."""
+    slack_sdk.web.base_client.json = _codec
+    slack_bolt.request.internals.json = _codec
+    slack_bolt.response.response.json = _codec
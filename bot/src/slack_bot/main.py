@@ -4,35 +4,130 @@ Slack Bot Lambda Handler
 Production-ready Slack bot using Slack Bolt framework with comprehensive
 error handling, monitoring, and security features.
 """
-import json
 import os
-from typing import Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 import boto3
+import orjson
 from slack_bolt import App
 from slack_bolt.adapter.aws_lambda import SlackRequestHandler
 from aws_lambda_powertools import Logger, Metrics, Tracer
 from aws_lambda_powertools.metrics import MetricUnit
 from botocore.exceptions import ClientError
 
-from blocks import action_data
+import json_codec
+from blocks import action_names, sorted_action_names, get_action_modal, mrkdwn, plain_text
+from secrets_cache import get_secret
+
+# Use orjson for Slack request parsing and payload serialization
+json_codec.install()
 
 # Initialize AWS Lambda Powertools
 logger = Logger(service=os.environ.get("POWERTOOLS_SERVICE_NAME", "slack-bot"))
 tracer = Tracer(service=os.environ.get("POWERTOOLS_SERVICE_NAME", "slack-bot"))
 metrics = Metrics(namespace="SlackBot", service="slack-bot")
 
-# Initialize AWS clients
-secrets_client = boto3.client("secretsmanager")
-codebuild_client = boto3.client("codebuild")
+# Single worker thread for Slack messages that can overlap with other I/O;
+# one worker keeps messages to a user in submission order
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+_MESSAGE_TIMEOUT_SECONDS = 10
+
+# AWS clients (created on first use)
+_codebuild_client = None
+
+# Environment variables passed to every action's CodeBuild project
+_ENV_VAR_NAMES = ("REQUEST_BODY", "TRIGGER_ID", "USER_ID", "USER_NAME")
+
+# Static views, built once since action_names does not change after import
+_ACTION_LIST_MD = "\n".join(f"• {name}" for name in sorted_action_names)
+
+_INITIAL_MODAL_VIEW: Dict[str, Any] = {
+    "type": "modal",
+    "callback_id": "initial_modal",
+    "title": plain_text("Senora Self-Service"),
+    "submit": plain_text("Next"),
+    "close": plain_text("Cancel"),
+    "blocks": [
+        {
+            "type": "section",
+            "text": mrkdwn("Select an action to perform:")
+        },
+        {
+            "type": "input",
+            "block_id": "action_select_block",
+            "element": {
+                "type": "static_select",
+                "action_id": "action_select",
+                "placeholder": plain_text("Choose an action..."),
+                "options": [
+                    {
+                        "text": plain_text(action_name),
+                        "value": action_name
+                    }
+                    for action_name in sorted_action_names
+                ]
+            },
+            "label": plain_text("Action")
+        }
+    ]
+}
+
+_HOME_VIEW: Dict[str, Any] = {
+    "type": "home",
+    "blocks": [
+        {
+            "type": "header",
+            "text": plain_text("🤖 Senora Self-Service Bot")
+        },
+        {
+            "type": "section",
+            "text": mrkdwn("Welcome! This bot provides self-service automation for common tasks.")
+        },
+        {
+            "type": "divider"
+        },
+        {
+            "type": "section",
+            "text": mrkdwn(
+                "*Getting Started:*\n"
+                "• Use `/senora` to see available actions\n"
+                "• Select an action and fill out the form\n"
+                "• You'll be notified when your request completes"
+            )
+        },
+        {
+            "type": "section",
+            "text": mrkdwn(f"*Available Actions:* {len(action_names)}\n{_ACTION_LIST_MD}")
+        }
+    ]
+}
+
 
 # Global variable for Slack app (initialized in get_slack_app)
 _slack_app: Optional[App] = None
 
 
+def _log_acknowledgment_failure(future: Future) -> None:
+    """Log a failed acknowledgment message; the action itself carries on."""
+    error = future.exception()
+    if error is not None:
+        logger.warning("Failed to send acknowledgment", extra={"error": str(error)})
+
+
+def _get_codebuild():
+    """Get or create the CodeBuild client."""
+    global _codebuild_client
+
+    if _codebuild_client is None:
+        _codebuild_client = boto3.client("codebuild")
+
+    return _codebuild_client
+
+
 @tracer.capture_method
 def get_slack_credentials() -> Dict[str, str]:
     """
-    Retrieve Slack credentials from AWS Secrets Manager.
+    Retrieve Slack credentials from AWS Secrets Manager (cached per container).
 
     Returns:
         Dict containing slack_signing_secret and slack_bot_token
@@ -47,21 +142,20 @@ def get_slack_credentials() -> Dict[str, str]:
         raise ValueError("SLACK_SECRET_TOKEN environment variable is required")
 
     try:
-        response = secrets_client.get_secret_value(SecretId=secret_name)
-        secret_data = json.loads(response["SecretString"])
+        secret_data = get_secret(secret_name)
 
         required_keys = ["slack_signing_secret", "slack_bot_token"]
         missing_keys = [key for key in required_keys if key not in secret_data]
 
         if missing_keys:
-            logger.error(f"Missing required keys in secret: {missing_keys}")
+            logger.error("Missing required keys in secret", extra={"missing_keys": missing_keys})
             raise ValueError(f"Secret missing keys: {missing_keys}")
 
         logger.info("Successfully retrieved Slack credentials")
         return secret_data
 
     except ClientError as e:
-        logger.error(f"Failed to retrieve secret: {e}")
+        logger.error("Failed to retrieve secret", extra={"error": str(e)})
         metrics.add_metric(name="SecretRetrievalError", unit=MetricUnit.Count, value=1)
         raise
 
@@ -105,7 +199,7 @@ def register_handlers(app: App) -> None:
             open_modal(client, body["trigger_id"])
             metrics.add_metric(name="ModalOpened", unit=MetricUnit.Count, value=1)
         except Exception as e:
-            logger.error(f"Error opening modal: {e}", exc_info=True)
+            logger.error("Error opening modal", extra={"error": str(e)}, exc_info=True)
             metrics.add_metric(name="ModalOpenError", unit=MetricUnit.Count, value=1)
             # Send error message to user
             try:
@@ -123,14 +217,12 @@ def register_handlers(app: App) -> None:
         metrics.add_metric(name="InitialModalSubmitted", unit=MetricUnit.Count, value=1)
 
         try:
-            selected_action = view["state"]["values"]["action_select_block"]["action_select"][
-                "selected_option"
-            ]["value"]
+            selected_action = _get_selected_action(view)
 
-            logger.info(f"Action selected: {selected_action}")
+            logger.info("Action selected", extra={"action": selected_action})
 
-            if selected_action not in action_data:
-                logger.error(f"Invalid action selected: {selected_action}")
+            if selected_action not in action_names:
+                logger.error("Invalid action selected", extra={"action": selected_action})
                 ack(
                     response_action="errors",
                     errors={"action_select_block": "Invalid action selected"}
@@ -145,8 +237,17 @@ def register_handlers(app: App) -> None:
 
             metrics.add_metric(name="ActionFormDisplayed", unit=MetricUnit.Count, value=1)
 
+        except ValueError as e:
+            # The action's modal.json is broken; it is only validated on first selection
+            logger.error("Action modal unavailable", extra={"error": str(e)})
+            metrics.add_metric(name="InitialModalError", unit=MetricUnit.Count, value=1)
+            ack(
+                response_action="errors",
+                errors={"action_select_block": "This action is currently unavailable."}
+            )
+
         except Exception as e:
-            logger.error(f"Error handling initial modal: {e}", exc_info=True)
+            logger.error("Error handling initial modal", extra={"error": str(e)}, exc_info=True)
             metrics.add_metric(name="InitialModalError", unit=MetricUnit.Count, value=1)
             ack(
                 response_action="errors",
@@ -165,42 +266,47 @@ def register_handlers(app: App) -> None:
             action_name = view["private_metadata"]
             user_id = body["user"]["id"]
 
-            logger.info(f"Executing action: {action_name} for user: {user_id}")
+            logger.info("Executing action", extra={"action": action_name, "user_id": user_id})
 
-            # Send immediate acknowledgment
-            client.chat_postMessage(
+            # Send immediate acknowledgment while the build is being started.
+            # All user messages go through the single-worker executor, so they
+            # are posted in submission order without waiting on each other here.
+            ack_future = _EXECUTOR.submit(
+                client.chat_postMessage,
                 channel=user_id,
                 text=f"✅ Your request for *{action_name}* has been received and is being processed..."
             )
+            ack_future.add_done_callback(_log_acknowledgment_failure)
 
             # Execute the action
             build_info = execute_action(action_name, body)
 
-            # Send confirmation with build details
-            client.chat_postMessage(
+            # Send confirmation with build details (queued behind the acknowledgment)
+            _EXECUTOR.submit(
+                client.chat_postMessage,
                 channel=user_id,
                 text=f"🚀 *{action_name}* is now running!\n"
                      f"Build ID: `{build_info['id']}`\n"
                      f"You'll be notified when it completes."
-            )
+            ).result(timeout=_MESSAGE_TIMEOUT_SECONDS)
 
             metrics.add_metric(name="ActionExecuted", unit=MetricUnit.Count, value=1)
             metrics.add_metadata(key="action_name", value=action_name)
 
         except Exception as e:
-            logger.error(f"Error executing action: {e}", exc_info=True)
+            logger.error("Error executing action", extra={"error": str(e)}, exc_info=True)
             metrics.add_metric(name="ActionExecutionError", unit=MetricUnit.Count, value=1)
 
             try:
-                client.chat_postMessage(
+                _EXECUTOR.submit(
+                    client.chat_postMessage,
                     channel=body["user"]["id"],
                     text=f"❌ Failed to execute action: {str(e)}\nPlease contact support if this continues."
-                )
+                ).result(timeout=_MESSAGE_TIMEOUT_SECONDS)
             except Exception:
                 pass  # Best effort
 
     @app.event("app_mention")
-    @tracer.capture_method
     def handle_app_mention(event, say):
         """Handle @bot mentions."""
         metrics.add_metric(name="AppMentioned", unit=MetricUnit.Count, value=1)
@@ -210,13 +316,14 @@ def register_handlers(app: App) -> None:
         )
 
     @app.event("message")
-    @tracer.capture_method
     def handle_direct_message(event, say):
         """Handle direct messages to the bot."""
         # Only respond to DMs (not channel messages)
-        if event.get("channel_type") == "im":
-            metrics.add_metric(name="DirectMessageReceived", unit=MetricUnit.Count, value=1)
-            say("Hello! Use `/senora` to access self-service automation.")
+        if event.get("channel_type") != "im":
+            return
+
+        metrics.add_metric(name="DirectMessageReceived", unit=MetricUnit.Count, value=1)
+        say("Hello! Use `/senora` to access self-service automation.")
 
     @app.event("app_home_opened")
     @tracer.capture_method
@@ -230,7 +337,7 @@ def register_handlers(app: App) -> None:
                 view=create_home_view()
             )
         except Exception as e:
-            logger.error(f"Error publishing home view: {e}", exc_info=True)
+            logger.error("Error publishing home view", extra={"error": str(e)}, exc_info=True)
 
 
 def open_modal(client, trigger_id: str) -> None:
@@ -241,44 +348,13 @@ def open_modal(client, trigger_id: str) -> None:
         client: Slack client
         trigger_id: Slack trigger ID from command invocation
     """
-    modal_view = {
-        "type": "modal",
-        "callback_id": "initial_modal",
-        "title": {"type": "plain_text", "text": "Senora Self-Service"},
-        "submit": {"type": "plain_text", "text": "Next"},
-        "close": {"type": "plain_text", "text": "Cancel"},
-        "blocks": [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "Select an action to perform:"
-                }
-            },
-            {
-                "type": "input",
-                "block_id": "action_select_block",
-                "element": {
-                    "type": "static_select",
-                    "action_id": "action_select",
-                    "placeholder": {
-                        "type": "plain_text",
-                        "text": "Choose an action..."
-                    },
-                    "options": [
-                        {
-                            "text": {"type": "plain_text", "text": action_name},
-                            "value": action_name
-                        }
-                        for action_name in sorted(action_data.keys())
-                    ]
-                },
-                "label": {"type": "plain_text", "text": "Action"}
-            }
-        ]
-    }
-
-    client.views_open(trigger_id=trigger_id, view=modal_view)
+    client.views_open(trigger_id=trigger_id, view=_INITIAL_MODAL_VIEW)
+
+
+def _get_selected_action(view: Dict[str, Any]) -> str:
+    """Return the action chosen in the initial modal's select menu."""
+    select_state = view["state"]["values"]["action_select_block"]["action_select"]
+    return select_state["selected_option"]["value"]
 
 
 def create_action_modal(action_name: str) -> Dict[str, Any]:
@@ -291,55 +367,20 @@ def create_action_modal(action_name: str) -> Dict[str, Any]:
     Returns:
         Modal view dictionary
     """
-    action_modal = action_data[action_name].copy()
-    action_modal["callback_id"] = "updated_modal"
-    action_modal["private_metadata"] = action_name
-
-    return action_modal
+    return get_action_modal(action_name)
 
 
 def create_home_view() -> Dict[str, Any]:
     """Create the bot's home tab view."""
-    return {
-        "type": "home",
-        "blocks": [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "🤖 Senora Self-Service Bot"
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "Welcome! This bot provides self-service automation for common tasks."
-                }
-            },
-            {
-                "type": "divider"
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*Getting Started:*\n"
-                           "• Use `/senora` to see available actions\n"
-                           "• Select an action and fill out the form\n"
-                           "• You'll be notified when your request completes"
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*Available Actions:* {len(action_data)}\n"
-                           + "\n".join(f"• {name}" for name in sorted(action_data.keys()))
-                }
-            }
-        ]
-    }
+    return _HOME_VIEW
+
+
+def _build_env_overrides(*values: str) -> List[Dict[str, str]]:
+    """Build CodeBuild environment overrides for values ordered as _ENV_VAR_NAMES."""
+    return [
+        {"name": name, "value": value, "type": "PLAINTEXT"}
+        for name, value in zip(_ENV_VAR_NAMES, values, strict=True)
+    ]
 
 
 @tracer.capture_method
@@ -359,42 +400,26 @@ def execute_action(action_name: str, request_body: Dict[str, Any]) -> Dict[str,
     """
     project_name = f"{os.environ.get('BOT_NAME', 'senora')}-{action_name}"
 
-    logger.info(f"Starting CodeBuild project: {project_name}")
+    logger.info("Starting CodeBuild project", extra={"project_name": project_name})
 
     try:
-        response = codebuild_client.start_build(
+        response = _get_codebuild().start_build(
             projectName=project_name,
-            environmentVariablesOverride=[
-                {
-                    "name": "REQUEST_BODY",
-                    "value": json.dumps(request_body),
-                    "type": "PLAINTEXT"
-                },
-                {
-                    "name": "TRIGGER_ID",
-                    "value": request_body.get("trigger_id", ""),
-                    "type": "PLAINTEXT"
-                },
-                {
-                    "name": "USER_ID",
-                    "value": request_body["user"]["id"],
-                    "type": "PLAINTEXT"
-                },
-                {
-                    "name": "USER_NAME",
-                    "value": request_body["user"]["name"],
-                    "type": "PLAINTEXT"
-                }
-            ]
+            environmentVariablesOverride=_build_env_overrides(
+                orjson.dumps(request_body).decode(),
+                request_body.get("trigger_id", ""),
+                request_body["user"]["id"],
+                request_body["user"]["name"],
+            )
         )
 
         build_info = response["build"]
-        logger.info(f"Build started successfully: {build_info['id']}")
+        logger.info("Build started successfully", extra={"build_id": build_info["id"]})
 
         return build_info
 
     except ClientError as e:
-        logger.error(f"Failed to start CodeBuild project: {e}", exc_info=True)
+        logger.error("Failed to start CodeBuild project", extra={"error": str(e)}, exc_info=True)
         metrics.add_metric(name="CodeBuildStartError", unit=MetricUnit.Count, value=1)
         raise
 
@@ -426,10 +451,10 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return response
 
     except Exception as e:
-        logger.error(f"Unhandled error in lambda_handler: {e}", exc_info=True)
+        logger.error("Unhandled error in lambda_handler", extra={"error": str(e)}, exc_info=True)
         metrics.add_metric(name="UnhandledError", unit=MetricUnit.Count, value=1)
 
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": "Internal server error"})
+            "body": orjson.dumps({"error": "Internal server error"}).decode()
         }
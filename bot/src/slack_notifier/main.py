@@ -3,23 +3,46 @@ Slack Notifier Lambda Function
 
 Sends notifications to Slack users after action completion.
 """
-import json
 import os
-from typing import Dict, Any
-import boto3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional
+from urllib.error import URLError
+import orjson
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from aws_lambda_powertools import Logger, Tracer, Metrics
 from aws_lambda_powertools.metrics import MetricUnit
 from botocore.exceptions import ClientError
 
-logger = Logger(service=os.environ.get("POWERTOOLS_SERVICE_NAME", "slack-notifier"))
+from secrets_cache import get_secret
+
+
+def _json_serializer(obj: Any) -> str:
+    """Serialize log records with orjson (Powertools expects a str)."""
+    return orjson.dumps(obj, default=str).decode()
+
+
+logger = Logger(
+    service=os.environ.get("POWERTOOLS_SERVICE_NAME", "slack-notifier"),
+    json_serializer=_json_serializer,
+)
 tracer = Tracer(service=os.environ.get("POWERTOOLS_SERVICE_NAME", "slack-notifier"))
 metrics = Metrics(namespace="SlackBot", service="slack-notifier")
 
-secrets_client = boto3.client("secretsmanager")
 _slack_client = None
 
+# Worker threads for sending batched notifications
+_EXECUTOR = ThreadPoolExecutor(max_workers=10)
+
+# Slack API error codes worth retrying; anything else would fail the same way again
+_RETRYABLE_SLACK_ERRORS = frozenset({
+    "ratelimited",
+    "internal_error",
+    "fatal_error",
+    "service_unavailable",
+    "request_timeout",
+})
+
 
 @tracer.capture_method
 def get_slack_client() -> WebClient:
@@ -30,15 +53,14 @@ def get_slack_client() -> WebClient:
         secret_name = os.environ.get("SLACK_SECRET_TOKEN")
 
         try:
-            response = secrets_client.get_secret_value(SecretId=secret_name)
-            secret_data = json.loads(response["SecretString"])
+            secret_data = get_secret(secret_name)
             bot_token = secret_data["slack_bot_token"]
 
             _slack_client = WebClient(token=bot_token)
             logger.info("Slack client initialized")
 
         except ClientError as e:
-            logger.error(f"Failed to get Slack credentials: {e}")
+            logger.error("Failed to get Slack credentials", extra={"error": str(e)})
             raise
 
     return _slack_client
@@ -65,13 +87,13 @@ def send_direct_message(user_id: str, message: str) -> Dict[str, Any]:
             mrkdwn=True
         )
 
-        logger.info(f"Message sent to user {user_id}")
+        logger.info("Message sent to user", extra={"user_id": user_id})
         metrics.add_metric(name="DirectMessageSent", unit=MetricUnit.Count, value=1)
 
         return response.data
 
     except SlackApiError as e:
-        logger.error(f"Slack API error: {e.response['error']}")
+        logger.error("Slack API error", extra={"error": e.response["error"]})
         metrics.add_metric(name="SlackApiError", unit=MetricUnit.Count, value=1)
         raise
 
@@ -99,17 +121,229 @@ def send_thread_reply(channel: str, thread_ts: str, message: str) -> Dict[str, A
             mrkdwn=True
         )
 
-        logger.info(f"Thread reply sent to channel {channel}")
+        logger.info("Thread reply sent", extra={"channel": channel})
         metrics.add_metric(name="ThreadReplySent", unit=MetricUnit.Count, value=1)
 
         return response.data
 
     except SlackApiError as e:
-        logger.error(f"Slack API error: {e.response['error']}")
+        logger.error("Slack API error", extra={"error": e.response["error"]})
         metrics.add_metric(name="SlackApiError", unit=MetricUnit.Count, value=1)
         raise
 
 
+def _validate_notification(notification: Dict[str, Any]) -> Optional[str]:
+    """
+    Check that a notification request has the fields its type needs.
+
+    Args:
+        notification: Notification request
+
+    Returns:
+        Error message if the request is invalid, otherwise None
+    """
+    if not notification.get("message"):
+        return "Message is required"
+
+    notification_type = notification.get("notification_type", "direct-message")
+
+    if notification_type == "direct-message":
+        if not notification.get("user_id"):
+            return "user_id is required for direct messages"
+
+    elif notification_type == "in-thread":
+        if not notification.get("channel") or not notification.get("thread_ts"):
+            return "channel and thread_ts required for thread replies"
+
+    else:
+        return f"Invalid notification_type: {notification_type}"
+
+    return None
+
+
+def _send_notification(notification: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate and send a single notification, letting send errors propagate.
+
+    Args:
+        notification: Notification request
+
+    Returns:
+        Response with status (400 for invalid requests)
+    """
+    error = _validate_notification(notification)
+
+    if error:
+        logger.error("Invalid notification request", extra={"error": error})
+        return {
+            "statusCode": 400,
+            "body": orjson.dumps({"error": error}).decode()
+        }
+
+    if notification.get("notification_type", "direct-message") == "in-thread":
+        response = send_thread_reply(
+            notification["channel"], notification["thread_ts"], notification["message"]
+        )
+    else:
+        response = send_direct_message(notification["user_id"], notification["message"])
+
+    logger.info("Notification sent successfully")
+
+    return {
+        "statusCode": 200,
+        "body": orjson.dumps({
+            "message": "Notification sent",
+            "response": response
+        }).decode()
+    }
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a send error is transient, so retrying the notification may succeed."""
+    if isinstance(error, SlackApiError):
+        status_code = error.response.status_code
+        return (
+            status_code == 429
+            or status_code >= 500
+            or error.response.get("error") in _RETRYABLE_SLACK_ERRORS
+        )
+
+    return isinstance(error, (URLError, TimeoutError, ConnectionError))
+
+
+@tracer.capture_method
+def process_notification(notification: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate and send a single notification.
+
+    Args:
+        notification: Notification request
+
+    Returns:
+        Response with status
+    """
+    logger.info("Processing notification", extra={"event": notification})
+
+    try:
+        return _send_notification(notification)
+
+    except Exception as e:
+        logger.error("Error sending notification", extra={"error": str(e)}, exc_info=True)
+        metrics.add_metric(name="NotificationError", unit=MetricUnit.Count, value=1)
+
+        return {
+            "statusCode": 500,
+            "body": orjson.dumps({"error": str(e)}).decode()
+        }
+
+
+def _post_notification(client: WebClient, notification: Dict[str, Any]) -> str:
+    """
+    Post a validated notification from a batch worker thread.
+
+    Makes no Powertools calls, since Metrics is not thread-safe and X-Ray
+    subsegments would not attach to the handler's trace; the caller records
+    the outcome once the result is collected.
+
+    Args:
+        client: Slack WebClient
+        notification: Validated notification request
+
+    Returns:
+        Name of the metric to record for the sent message
+    """
+    if notification.get("notification_type", "direct-message") == "in-thread":
+        client.chat_postMessage(
+            channel=notification["channel"],
+            thread_ts=notification["thread_ts"],
+            text=notification["message"],
+            mrkdwn=True
+        )
+        return "ThreadReplySent"
+
+    client.chat_postMessage(
+        channel=notification["user_id"],
+        text=notification["message"],
+        mrkdwn=True
+    )
+    return "DirectMessageSent"
+
+
+@tracer.capture_method
+def process_batch(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Send a batch of SQS notification records concurrently.
+
+    Args:
+        records: SQS records whose bodies are notification requests
+
+    Returns:
+        Partial batch response listing the records that failed transiently
+    """
+    logger.info("Processing notification batch", extra={"record_count": len(records)})
+
+    # Initialize the shared client up front so worker threads don't race on it
+    client = get_slack_client()
+
+    failures = []
+    futures = {}
+
+    for record in records:
+        try:
+            notification = orjson.loads(record["body"])
+        except orjson.JSONDecodeError as e:
+            logger.error(
+                "Invalid JSON in notification record",
+                extra={"message_id": record["messageId"], "error": str(e)}
+            )
+            metrics.add_metric(name="NotificationError", unit=MetricUnit.Count, value=1)
+            continue
+
+        if not isinstance(notification, dict):
+            logger.error(
+                "Notification record is not a JSON object",
+                extra={"message_id": record["messageId"]}
+            )
+            metrics.add_metric(name="NotificationError", unit=MetricUnit.Count, value=1)
+            continue
+
+        error = _validate_notification(notification)
+        if error:
+            logger.error(
+                "Invalid notification request",
+                extra={"message_id": record["messageId"], "error": error}
+            )
+            metrics.add_metric(name="NotificationError", unit=MetricUnit.Count, value=1)
+            continue
+
+        futures[_EXECUTOR.submit(_post_notification, client, notification)] = record["messageId"]
+
+    # Outcomes are logged and counted here, on the handler thread
+    for future in as_completed(futures):
+        message_id = futures[future]
+
+        try:
+            metric_name = future.result()
+        except Exception as e:
+            retryable = _is_retryable(e)
+            logger.error(
+                "Error sending notification",
+                extra={"message_id": message_id, "error": str(e), "retryable": retryable},
+                exc_info=e
+            )
+            if isinstance(e, SlackApiError):
+                metrics.add_metric(name="SlackApiError", unit=MetricUnit.Count, value=1)
+            metrics.add_metric(name="NotificationError", unit=MetricUnit.Count, value=1)
+
+            if retryable:
+                failures.append({"itemIdentifier": message_id})
+            continue
+
+        metrics.add_metric(name=metric_name, unit=MetricUnit.Count, value=1)
+
+    return {"batchItemFailures": failures}
+
+
 @metrics.log_metrics(capture_cold_start_metric=True)
 @tracer.capture_lambda_handler
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -125,72 +359,18 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         "thread_ts": "1234567890.123456" (for in-thread)
     }
 
+    SQS events are also accepted, with one such notification per record
+    body. Failed records are returned as batchItemFailures, which requires
+    ReportBatchItemFailures on the event source mapping.
+
     Args:
-        event: Notification request
+        event: Notification request or SQS event
         context: Lambda context
 
     Returns:
-        Response with status
+        Response with status, or a partial batch response for SQS events
     """
-    logger.info(f"Processing notification: {json.dumps(event)}")
-
-    try:
-        notification_type = event.get("notification_type", "direct-message")
-        message = event.get("message", "")
-
-        if not message:
-            logger.error("No message provided")
-            return {
-                "statusCode": 400,
-                "body": json.dumps({"error": "Message is required"})
-            }
-
-        if notification_type == "direct-message":
-            user_id = event.get("user_id")
-            if not user_id:
-                logger.error("No user_id provided for direct message")
-                return {
-                    "statusCode": 400,
-                    "body": json.dumps({"error": "user_id is required for direct messages"})
-                }
-
-            response = send_direct_message(user_id, message)
-
-        elif notification_type == "in-thread":
-            channel = event.get("channel")
-            thread_ts = event.get("thread_ts")
-
-            if not channel or not thread_ts:
-                logger.error("Missing channel or thread_ts for thread reply")
-                return {
-                    "statusCode": 400,
-                    "body": json.dumps({"error": "channel and thread_ts required for thread replies"})
-                }
-
-            response = send_thread_reply(channel, thread_ts, message)
-
-        else:
-            logger.error(f"Invalid notification type: {notification_type}")
-            return {
-                "statusCode": 400,
-                "body": json.dumps({"error": f"Invalid notification_type: {notification_type}"})
-            }
-
-        logger.info("Notification sent successfully")
-
-        return {
-            "statusCode": 200,
-            "body": json.dumps({
-                "message": "Notification sent",
-                "response": response
-            })
-        }
+    if event.get("Records"):
+        return process_batch(event["Records"])
 
-    except Exception as e:
-        logger.error(f"Error sending notification: {e}", exc_info=True)
-        metrics.add_metric(name="NotificationError", unit=MetricUnit.Count, value=1)
-
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": str(e)})
-        }
+    return process_notification(event)